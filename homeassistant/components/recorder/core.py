@@ -174,6 +174,10 @@ class Recorder(threading.Thread):
         self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
+        # Cache of statistics metadata, maintained by statistics.py
+        self.statistics_meta_cache: dict[str, tuple[int, StatisticMetaData]] = {}
+        self.statistics_meta_cache_complete = False
+        self.statistics_meta_cache_generation = 0
         self._pending_expunge: list[States] = []
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -1025,6 +1029,11 @@ class Recorder(threading.Thread):
             # it tried to import it below.
             with contextlib.suppress(ImportError):
                 kwargs["connect_args"] = {"conv": build_mysqldb_conv()}
+        elif self.db_url.startswith(("postgresql://", "postgresql+psycopg2://")):
+            # Batch executemany inserts into multi-valued statements
+            # instead of one round trip per row
+            kwargs["executemany_mode"] = "values_plus_batch"
+            kwargs["echo"] = False
         else:
             kwargs["echo"] = False
 
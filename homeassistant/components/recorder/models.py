@@ -473,7 +473,8 @@ class Statistics(Base, StatisticsBase):  # type: ignore[misc,valid-type]
     duration = timedelta(hours=1)
 
     __table_args__ = (
-        # Used for fetching statistics for a certain entity at a specific time
+        # Used for fetching statistics for a certain entity at a specific time,
+        # and as the covering index for range and latest-row queries
         Index("ix_statistics_statistic_id_start", "metadata_id", "start", unique=True),
     )
     __tablename__ = TABLE_STATISTICS
@@ -485,7 +486,8 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore[misc,valid-type
     duration = timedelta(minutes=5)
 
     __table_args__ = (
-        # Used for fetching statistics for a certain entity at a specific time
+        # Used for fetching statistics for a certain entity at a specific time,
+        # and as the covering index for range and latest-row queries
         Index(
             "ix_statistics_short_term_statistic_id_start",
             "metadata_id",
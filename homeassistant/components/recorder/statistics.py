@@ -1,20 +1,21 @@
 """Statistics helper."""
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable, Iterable
 import contextlib
 import dataclasses
-from datetime import datetime, timedelta
-from itertools import chain, groupby
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from itertools import chain
 import json
 import logging
+from operator import attrgetter
 import os
 import re
-from statistics import mean
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
-from sqlalchemy import bindparam, func, lambda_stmt, select
+from sqlalchemy import bindparam, delete, func, lambda_stmt, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -83,16 +84,11 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
-QUERY_STATISTICS_SUMMARY_MEAN = [
+QUERY_STATISTICS_SUMMARY = [
     StatisticsShortTerm.metadata_id,
-    func.avg(StatisticsShortTerm.mean),
-    func.min(StatisticsShortTerm.min),
-    func.max(StatisticsShortTerm.max),
-]
-
-QUERY_STATISTICS_SUMMARY_SUM = [
-    StatisticsShortTerm.metadata_id,
-    StatisticsShortTerm.start,
+    StatisticsShortTerm.mean,
+    StatisticsShortTerm.min,
+    StatisticsShortTerm.max,
     StatisticsShortTerm.last_reset,
     StatisticsShortTerm.state,
     StatisticsShortTerm.sum,
@@ -127,25 +123,42 @@ QUERY_STATISTIC_META_ID = [
 ]
 
 
-# Convert pressure, temperature and volume statistics from the normalized unit used for
-# statistics to the unit configured by the user
-STATISTIC_UNIT_TO_DISPLAY_UNIT_CONVERSIONS = {
-    PRESSURE_PA: lambda x, units: pressure_util.convert(
-        x, PRESSURE_PA, units.pressure_unit
-    )
-    if x is not None
-    else None,
-    TEMP_CELSIUS: lambda x, units: temperature_util.convert(
-        x, TEMP_CELSIUS, units.temperature_unit
-    )
-    if x is not None
-    else None,
-    VOLUME_CUBIC_METERS: lambda x, units: volume_util.convert(
-        x, VOLUME_CUBIC_METERS, _configured_unit(VOLUME_CUBIC_METERS, units)
-    )
-    if x is not None
-    else None,
-}
+@lru_cache(maxsize=4)
+def _display_unit_converters(
+    pressure_unit: str, temperature_unit: str, is_metric: bool
+) -> dict[str, Callable[[float | None], float | None]]:
+    """Map the normalized statistic units to display unit converters.
+
+    The unit configured by the user is baked into each converter so
+    converting a value is a single dict lookup and call.
+    """
+    volume_unit = VOLUME_CUBIC_METERS if is_metric else VOLUME_CUBIC_FEET
+
+    # The pressure and volume conversions are pure scalings; reduce each
+    # to a precomputed factor so converting a value is plain float
+    # arithmetic instead of a unit lookup per call. Temperature keeps
+    # calling temperature_util so the results match the rest of Home
+    # Assistant bit for bit.
+    pressure_scale = pressure_util.convert(1, PRESSURE_PA, pressure_unit)
+    volume_scale = volume_util.convert(1, VOLUME_CUBIC_METERS, volume_unit)
+
+    def _convert_pressure(value: float | None) -> float | None:
+        return value * pressure_scale if value is not None else None
+
+    def _convert_temperature(value: float | None) -> float | None:
+        if value is None:
+            return None
+        return temperature_util.convert(value, TEMP_CELSIUS, temperature_unit)
+
+    def _convert_volume(value: float | None) -> float | None:
+        return value * volume_scale if value is not None else None
+
+    return {
+        PRESSURE_PA: _convert_pressure,
+        TEMP_CELSIUS: _convert_temperature,
+        VOLUME_CUBIC_METERS: _convert_volume,
+    }
+
 
 # Convert volume statistics from the display unit configured by the user
 # to the normalized unit used for statistics
@@ -158,6 +171,32 @@ DISPLAY_UNIT_TO_STATISTIC_UNIT_CONVERSIONS: dict[
     ),
 }
 
+
+def _identity_convert(value: float, _units: UnitSystem) -> float:
+    """Return a value unconverted, for units needing no conversion."""
+    return value
+
+
+_STATISTIC_ROW_KEYS = (
+    "start",
+    "mean",
+    "min",
+    "max",
+    "last_reset",
+    "state",
+    "sum",
+)
+
+# Columns updated when an external source resends an existing period
+_STATISTIC_UPDATE_KEYS = (
+    "mean",
+    "min",
+    "max",
+    "last_reset",
+    "state",
+    "sum",
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -174,13 +213,20 @@ def split_statistic_id(entity_id: str) -> list[str]:
     return entity_id.split(":", 1)
 
 
-VALID_STATISTIC_ID = re.compile(r"^(?!.+__)(?!_)[\da-z_]+(?<!_):(?!_)[\da-z_]+(?<!_)$")
+# Both the domain and the statistic are slugs: groups of [a-z0-9] separated by
+# single underscores. Written without lookarounds so the regex engine never
+# needs to backtrack when rejecting invalid ids.
+VALID_STATISTIC_ID = re.compile(r"^[\da-z]+(?:_[\da-z]+)*:[\da-z]+(?:_[\da-z]+)*$")
 
 
+@lru_cache(maxsize=4096)
 def valid_statistic_id(statistic_id: str) -> bool:
     """Test if a statistic ID is a valid format.
 
     Format: <domain>:<statistic> where both are slugs.
+
+    The same statistic ids are validated over and over again, so the
+    result is cached.
     """
     return VALID_STATISTIC_ID.match(statistic_id) is not None
 
@@ -217,6 +263,7 @@ def async_setup(hass: HomeAssistant) -> None:
                 (StatisticsMeta.statistic_id == old_entity_id)
                 & (StatisticsMeta.source == DOMAIN)
             ).update({StatisticsMeta.statistic_id: entity_id})
+        _clear_metadata_cache(hass, (old_entity_id, entity_id))
 
     async def _async_entity_id_changed(event: Event) -> None:
         await hass.data[DATA_INSTANCE].async_add_executor_job(_entity_id_changed, event)
@@ -246,29 +293,54 @@ def get_start_time() -> datetime:
     return last_period
 
 
+def _clear_metadata_cache(
+    hass: HomeAssistant, statistic_ids: Iterable[str] | None = None
+) -> None:
+    """Drop cached statistics metadata after the database was modified."""
+    instance: Recorder | None = hass.data.get(DATA_INSTANCE)
+    if instance is None:
+        return
+    # Bump the generation first so readers which already fetched from the
+    # database before this invalidation skip repopulating the cache
+    instance.statistics_meta_cache_generation += 1
+    instance.statistics_meta_cache_complete = False
+    if statistic_ids is None:
+        instance.statistics_meta_cache.clear()
+        return
+    for statistic_id in statistic_ids:
+        instance.statistics_meta_cache.pop(statistic_id, None)
+
+
 def _update_or_add_metadata(
     session: Session,
     new_metadata: StatisticMetaData,
     old_metadata_dict: dict[str, tuple[int, StatisticMetaData]],
+    modified_statistic_ids: set[str],
 ) -> int:
     """Get metadata_id for a statistic_id.
 
     If the statistic_id is previously unknown, add it. If it's already known, update
     metadata if needed.
 
+    Inserted or updated statistic_ids are added to modified_statistic_ids;
+    the caller must pass them to _clear_metadata_cache once the session
+    has committed, so concurrent reads cannot repopulate the cache from
+    rows which are later rolled back.
+
     Updating metadata source is not possible.
     """
     statistic_id = new_metadata["statistic_id"]
     if statistic_id not in old_metadata_dict:
-        meta = StatisticsMeta.from_meta(new_metadata)
-        session.add(meta)
-        session.flush()  # Flush to get the metadata id assigned
+        # Insert with Core so no ORM flush is needed to get the id assigned
+        result = session.execute(StatisticsMeta.__table__.insert(), dict(new_metadata))
+        metadata_id: int = result.inserted_primary_key[0]
+        modified_statistic_ids.add(statistic_id)
         _LOGGER.debug(
             "Added new statistics metadata for %s, new_metadata: %s",
             statistic_id,
             new_metadata,
         )
-        return meta.id  # type: ignore[no-any-return]
+        return metadata_id
 
     metadata_id, old_metadata = old_metadata_dict[statistic_id]
     if (
@@ -284,6 +356,7 @@ def _update_or_add_metadata(
             },
             synchronize_session=False,
         )
+        modified_statistic_ids.add(statistic_id)
         _LOGGER.debug(
             "Updated statistics metadata for %s, old_metadata: %s, new_metadata: %s",
             statistic_id,
@@ -320,7 +393,8 @@ def _find_duplicates(
         .limit(1000 * MAX_ROWS_TO_PURGE)
     )
     duplicates = execute(query)
-    original_as_dict = {}
+    original = None
+    original_values: tuple | None = None
     start = None
     metadata_id = None
     duplicate_ids: list[int] = []
@@ -329,54 +403,65 @@ def _find_duplicates(
     if not duplicates:
         return (duplicate_ids, non_identical_duplicates_as_dict)
 
-    def columns_to_dict(duplicate: type[Statistics | StatisticsShortTerm]) -> dict:
+    all_columns = tuple(table.__mapper__.c.keys())
+    # Compare rows as tuples, ignoring id and created
+    compare_values = attrgetter(
+        *(key for key in all_columns if key not in ("id", "created"))
+    )
+
+    def columns_to_dict(row: Statistics | StatisticsShortTerm) -> dict:
         """Convert a SQLAlchemy row to dict."""
-        dict_ = {}
-        for key in duplicate.__mapper__.c.keys():
-            dict_[key] = getattr(duplicate, key)
-        return dict_
-
-    def compare_statistic_rows(row1: dict, row2: dict) -> bool:
-        """Compare two statistics rows, ignoring id and created."""
-        ignore_keys = ["id", "created"]
-        keys1 = set(row1).difference(ignore_keys)
-        keys2 = set(row2).difference(ignore_keys)
-        return keys1 == keys2 and all(row1[k] == row2[k] for k in keys1)
+        return {key: getattr(row, key) for key in all_columns}
 
     for duplicate in duplicates:
         if start != duplicate.start or metadata_id != duplicate.metadata_id:
-            original_as_dict = columns_to_dict(duplicate)
+            original = duplicate
+            original_values = compare_values(duplicate)
             start = duplicate.start
             metadata_id = duplicate.metadata_id
             continue
-        duplicate_as_dict = columns_to_dict(duplicate)
         duplicate_ids.append(duplicate.id)
-        if not compare_statistic_rows(original_as_dict, duplicate_as_dict):
+        if compare_values(duplicate) != original_values:
+            # The first iteration always assigns original
+            assert original is not None
             non_identical_duplicates_as_dict.append(
-                {"duplicate": duplicate_as_dict, "original": original_as_dict}
+                {
+                    "duplicate": columns_to_dict(duplicate),
+                    "original": columns_to_dict(original),
+                }
             )
 
     return (duplicate_ids, non_identical_duplicates_as_dict)
 
 
+def _delete_duplicates_stmt(
+    table: type[Statistics | StatisticsShortTerm],
+) -> StatementLambdaElement:
+    """Generate a statement to delete statistics rows by id."""
+    return lambda_stmt(
+        lambda: delete(table)
+        .where(table.id.in_(bindparam("ids", expanding=True)))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def _delete_duplicates_from_table(
     session: Session, table: type[Statistics | StatisticsShortTerm]
 ) -> tuple[int, list[dict]]:
     """Identify and delete duplicated statistics from a specified table."""
     all_non_identical_duplicates: list[dict] = []
     total_deleted_rows = 0
+    stmt = _delete_duplicates_stmt(table)
     while True:
         duplicate_ids, non_identical_duplicates = _find_duplicates(session, table)
         if not duplicate_ids:
             break
         all_non_identical_duplicates.extend(non_identical_duplicates)
         for i in range(0, len(duplicate_ids), MAX_ROWS_TO_PURGE):
-            deleted_rows = (
-                session.query(table)
-                .filter(table.id.in_(duplicate_ids[i : i + MAX_ROWS_TO_PURGE]))
-                .delete(synchronize_session=False)
+            deleted_rows = session.execute(
+                stmt, {"ids": duplicate_ids[i : i + MAX_ROWS_TO_PURGE]}
             )
-            total_deleted_rows += deleted_rows
+            total_deleted_rows += deleted_rows.rowcount
     return (total_deleted_rows, all_non_identical_duplicates)
 
 
@@ -398,13 +483,15 @@ def delete_duplicates(hass: HomeAssistant, session: Session) -> None:
 
         os.makedirs(os.path.dirname(backup_path), exist_ok=True)
         with open(backup_path, "w", encoding="utf8") as backup_file:
-            json.dump(
-                non_identical_duplicates,
-                backup_file,
-                indent=4,
-                sort_keys=True,
-                cls=JSONEncoder,
-            )
+            # Write the rows compact, one duplicate per line; pretty printing
+            # and key sorting are by far the slowest paths of the json module
+            # and the backup may hold tens of thousands of rows
+            backup_file.write("[\n")
+            for i, duplicate in enumerate(non_identical_duplicates):
+                if i > 0:
+                    backup_file.write(",\n")
+                json.dump(duplicate, backup_file, cls=JSONEncoder)
+            backup_file.write("\n]")
         _LOGGER.warning(
             "Deleted %s non identical duplicated %s rows, a backup of the deleted rows "
             "has been saved to %s",
@@ -423,20 +510,6 @@ def delete_duplicates(hass: HomeAssistant, session: Session) -> None:
         )
 
 
-def _compile_hourly_statistics_summary_mean_stmt(
-    start_time: datetime, end_time: datetime
-) -> StatementLambdaElement:
-    """Generate the summary mean statement for hourly statistics."""
-    stmt = lambda_stmt(lambda: select(*QUERY_STATISTICS_SUMMARY_MEAN))
-    stmt += (
-        lambda q: q.filter(StatisticsShortTerm.start >= start_time)
-        .filter(StatisticsShortTerm.start < end_time)
-        .group_by(StatisticsShortTerm.metadata_id)
-        .order_by(StatisticsShortTerm.metadata_id)
-    )
-    return stmt
-
-
 def compile_hourly_statistics(
     instance: Recorder, session: Session, start: datetime
 ) -> None:
@@ -445,61 +518,77 @@ def compile_hourly_statistics(
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Both parts are pulled from a single scan of the hour's short term
+    statistics by joining the aggregates with the last row of each series.
     """
     start_time = start.replace(minute=0)
     end_time = start_time + timedelta(hours=1)
 
-    # Compute last hour's average, min, max
-    summary: dict[str, StatisticData] = {}
-    stmt = _compile_hourly_statistics_summary_mean_stmt(start_time, end_time)
-    stats = execute_stmt_lambda_element(session, stmt)
-
-    if stats:
-        for stat in stats:
-            metadata_id, _mean, _min, _max = stat
-            summary[metadata_id] = {
-                "start": start_time,
-                "mean": _mean,
-                "min": _min,
-                "max": _max,
-            }
-
-    # Get last hour's last sum
-    subquery = (
-        session.query(*QUERY_STATISTICS_SUMMARY_SUM)
+    short_term = (
+        session.query(*QUERY_STATISTICS_SUMMARY)
         .filter(StatisticsShortTerm.start >= bindparam("start_time"))
         .filter(StatisticsShortTerm.start < bindparam("end_time"))
+        .cte()
+    )
+    summary_mean = (
+        session.query(
+            short_term.c.metadata_id,
+            func.avg(short_term.c.mean).label("mean"),
+            func.min(short_term.c.min).label("min"),
+            func.max(short_term.c.max).label("max"),
+        )
+        .group_by(short_term.c.metadata_id)
+        .subquery()
+    )
+    summary_sum = (
+        session.query(
+            short_term.c.metadata_id,
+            short_term.c.last_reset,
+            short_term.c.state,
+            short_term.c.sum,
+        )
+        .filter(short_term.c.rownum == 1)
         .subquery()
     )
     query = (
-        session.query(subquery)
-        .filter(subquery.c.rownum == 1)
-        .order_by(subquery.c.metadata_id)
+        session.query(
+            summary_mean.c.metadata_id,
+            summary_mean.c.mean,
+            summary_mean.c.min,
+            summary_mean.c.max,
+            summary_sum.c.last_reset,
+            summary_sum.c.state,
+            summary_sum.c.sum,
+        )
+        .join(summary_sum, summary_sum.c.metadata_id == summary_mean.c.metadata_id)
+        .order_by(summary_mean.c.metadata_id)
     )
     stats = execute(query.params(start_time=start_time, end_time=end_time))
 
+    summary: dict[int, StatisticData] = {}
     if stats:
+        # last_reset rarely changes and is shared by many statistic series,
+        # cache the timestamp conversion for this compile cycle
+        last_reset_as_utc = lru_cache(maxsize=None)(process_timestamp)
         for stat in stats:
-            metadata_id, start, last_reset, state, _sum, _ = stat
-            if metadata_id in summary:
-                summary[metadata_id].update(
-                    {
-                        "last_reset": process_timestamp(last_reset),
-                        "state": state,
-                        "sum": _sum,
-                    }
-                )
-            else:
-                summary[metadata_id] = {
-                    "start": start_time,
-                    "last_reset": process_timestamp(last_reset),
-                    "state": state,
-                    "sum": _sum,
-                }
+            metadata_id, _mean, _min, _max, last_reset, state, _sum = stat
+            summary[metadata_id] = {
+                "start": start_time,
+                "mean": _mean,
+                "min": _min,
+                "max": _max,
+                "last_reset": last_reset_as_utc(last_reset),
+                "state": state,
+                "sum": _sum,
+            }
 
-    # Insert compiled hourly statistics in the database
-    for metadata_id, stat in summary.items():
-        session.add(Statistics.from_stats(metadata_id, stat))
+    # Insert compiled hourly statistics in the database with a single executemany
+    _insert_statistics_rows(
+        session,
+        Statistics,
+        [_statistics_row(metadata_id, stat) for metadata_id, stat in summary.items()],
+    )
 
 
 @retryable_database_job("statistics")
@@ -537,21 +626,26 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
+    if not platform_stats and start.minute != 55:
+        # No platform produced statistics and no hourly summary is due,
+        # just record the run
+        with session_scope(session=instance.get_session()) as session:
+            session.execute(StatisticsRuns.__table__.insert(), {"start": start})
+        return True
+
     # Insert collected statistics in the database
+    modified_statistic_ids: set[str] = set()
     with session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
+        rows: list[dict] = []
         for stats in platform_stats:
             metadata_id = _update_or_add_metadata(
-                session, stats["meta"], current_metadata
-            )
-            _insert_statistics(
-                session,
-                StatisticsShortTerm,
-                metadata_id,
-                stats["stat"],
+                session, stats["meta"], current_metadata, modified_statistic_ids
             )
+            rows.append(_statistics_row(metadata_id, stats["stat"]))
+        _insert_statistics_rows(session, StatisticsShortTerm, rows)
 
         if start.minute == 55:
             # A full hour is ready, summarize it
@@ -559,9 +653,26 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    if modified_statistic_ids:
+        _clear_metadata_cache(instance.hass, modified_statistic_ids)
+
     return True
 
 
+@lru_cache(maxsize=4)
+def _adjust_sum_statistics_stmt(
+    table: type[Statistics | StatisticsShortTerm],
+) -> StatementLambdaElement:
+    """Generate a statement to adjust statistics sums from a start time."""
+    return lambda_stmt(
+        lambda: update(table)
+        .where(table.metadata_id == bindparam("b_metadata_id"))
+        .where(table.start >= bindparam("b_start_time"))
+        .values({table.sum: table.sum + bindparam("b_adj")})
+        .execution_options(synchronize_session=False)
+    )
+
+
 def _adjust_sum_statistics(
     session: Session,
     table: type[Statistics | StatisticsShortTerm],
@@ -571,19 +682,57 @@ def _adjust_sum_statistics(
 ) -> None:
     """Adjust statistics in the database."""
     try:
-        session.query(table).filter_by(metadata_id=metadata_id).filter(
-            table.start >= start_time
-        ).update(
-            {
-                table.sum: table.sum + adj,
-            },
-            synchronize_session=False,
+        session.execute(
+            # Mismatch because the untyped declarative base hides Hashable
+            _adjust_sum_statistics_stmt(table),  # type: ignore[arg-type]
+            {"b_metadata_id": metadata_id, "b_start_time": start_time, "b_adj": adj},
         )
     except SQLAlchemyError:
         _LOGGER.exception(
             "Unexpected exception when updating statistics %s",
-            id,
+            metadata_id,
+        )
+
+
+def _statistics_row(metadata_id: int, statistic: StatisticData) -> dict:
+    """Convert a statistic to a parameter dict for an executemany insert.
+
+    All columns are included so the rows of one batch share the same keys.
+    """
+    row: dict = {key: statistic.get(key) for key in _STATISTIC_ROW_KEYS}
+    row["metadata_id"] = metadata_id
+    return row
+
+
+def _insert_statistics_rows(
+    session: Session,
+    table: type[Statistics | StatisticsShortTerm],
+    rows: list[dict],
+) -> None:
+    """Insert statistics rows in the database with a single executemany.
+
+    If the batched insert fails, retry row by row so a single bad row does
+    not discard the other statistics of the batch.
+    """
+    if not rows:
+        return
+    try:
+        with session.begin_nested():
+            session.execute(table.__table__.insert(), rows)
+        return
+    except SQLAlchemyError:
+        _LOGGER.debug(
+            "Batched insert of statistics failed, retrying row by row", exc_info=True
         )
+    for row in rows:
+        try:
+            with session.begin_nested():
+                session.execute(table.__table__.insert(), row)
+        except SQLAlchemyError:
+            _LOGGER.exception(
+                "Unexpected exception when inserting statistics %s",
+                row,
+            )
 
 
 def _insert_statistics(
@@ -630,17 +779,53 @@ def _update_statistics(
         )
 
 
+@lru_cache(maxsize=8)
+def _upsert_statistics_stmt(
+    table: type[Statistics | StatisticsShortTerm], dialect_name: str
+) -> Any | None:
+    """Generate an upsert statement keyed on (metadata_id, start).
+
+    Returns None for dialects without native upsert support; callers fall
+    back to selecting the existing row and updating or inserting.
+    """
+    if dialect_name in (SupportedDialect.SQLITE, SupportedDialect.POSTGRESQL):
+        if dialect_name == SupportedDialect.SQLITE:
+            insert_stmt = sqlite.insert(table.__table__)
+        else:
+            insert_stmt = postgresql.insert(table.__table__)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["metadata_id", "start"],
+            set_={key: insert_stmt.excluded[key] for key in _STATISTIC_UPDATE_KEYS},
+        )
+    if dialect_name == SupportedDialect.MYSQL:
+        mysql_stmt = mysql.insert(table.__table__)
+        return mysql_stmt.on_duplicate_key_update(
+            **{key: mysql_stmt.inserted[key] for key in _STATISTIC_UPDATE_KEYS}
+        )
+    return None
+
+
+@lru_cache(maxsize=12)
 def _generate_get_metadata_stmt(
-    statistic_ids: list[str] | tuple[str] | None = None,
-    statistic_type: Literal["mean"] | Literal["sum"] | None = None,
-    statistic_source: str | None = None,
+    has_statistic_ids: bool,
+    statistic_type: Literal["mean"] | Literal["sum"] | None,
+    has_statistic_source: bool,
 ) -> StatementLambdaElement:
-    """Generate a statement to fetch metadata."""
+    """Generate a statement to fetch metadata.
+
+    The statement is cached per call shape; the statistic_ids and the
+    source are bound at execution time so all id lists share the same
+    prepared statement.
+    """
     stmt = lambda_stmt(lambda: select(*QUERY_STATISTIC_META))
-    if statistic_ids is not None:
-        stmt += lambda q: q.where(StatisticsMeta.statistic_id.in_(statistic_ids))
-    if statistic_source is not None:
-        stmt += lambda q: q.where(StatisticsMeta.source == statistic_source)
+    if has_statistic_ids:
+        stmt += lambda q: q.where(
+            StatisticsMeta.statistic_id.in_(bindparam("statistic_ids", expanding=True))
+        )
+    if has_statistic_source:
+        stmt += lambda q: q.where(
+            StatisticsMeta.source == bindparam("statistic_source")
+        )
     if statistic_type == "mean":
         stmt += lambda q: q.where(StatisticsMeta.has_mean == true())
     elif statistic_type == "sum":
@@ -663,14 +848,49 @@ def get_metadata_with_session(
     If statistic_ids is given, fetch metadata only for the listed statistics_ids.
     If statistic_type is given, fetch metadata only for statistic_ids supporting it.
     """
+    instance: Recorder | None = hass.data.get(DATA_INSTANCE)
+
+    # Metadata rarely changes; serve plain statistic_id lookups from the
+    # cache on the recorder instance instead of querying per call. Copies
+    # are handed out so callers cannot mutate the cached entries.
+    cache = instance.statistics_meta_cache if instance else None
+    cacheable = statistic_type is None and statistic_source is None
+    if cache is not None and cacheable:
+        if statistic_ids is not None:
+            # A single .get() per statistic_id so an invalidation on
+            # another thread between the lookups cannot raise; any
+            # missing entry falls through to the database
+            cached: dict[str, tuple[int, StatisticMetaData]] = {}
+            for statistic_id in statistic_ids:
+                if (entry := cache.get(statistic_id)) is None:
+                    break
+                cached[statistic_id] = (
+                    entry[0],
+                    cast(StatisticMetaData, dict(entry[1])),
+                )
+            else:
+                return cached
+        elif instance and instance.statistics_meta_cache_complete:
+            return {
+                statistic_id: (metadata_id, cast(StatisticMetaData, dict(meta)))
+                for statistic_id, (metadata_id, meta) in list(cache.items())
+            }
 
     # Fetch metatadata from the database
-    stmt = _generate_get_metadata_stmt(statistic_ids, statistic_type, statistic_source)
-    result = execute_stmt_lambda_element(session, stmt)
-    if not result:
-        return {}
+    stmt = _generate_get_metadata_stmt(
+        statistic_ids is not None, statistic_type, statistic_source is not None
+    )
+    params: dict[str, Any] = {}
+    if statistic_ids is not None:
+        params["statistic_ids"] = list(statistic_ids)
+    if statistic_source is not None:
+        params["statistic_source"] = statistic_source
+    # Snapshot the cache generation before reading so an invalidation
+    # racing with this fetch stops the result from being cached below
+    cache_generation = instance.statistics_meta_cache_generation if instance else 0
+    result = execute_stmt_lambda_element(session, stmt, params=params, mapped=True)
 
-    return {
+    metadata: dict[str, tuple[int, StatisticMetaData]] = {
         meta["statistic_id"]: (
             meta["id"],
             {
@@ -685,6 +905,19 @@ def get_metadata_with_session(
         for meta in result
     }
 
+    if (
+        cache is not None
+        and cacheable
+        and instance
+        and instance.statistics_meta_cache_generation == cache_generation
+    ):
+        for statistic_id, (metadata_id, meta) in metadata.items():
+            cache[statistic_id] = (metadata_id, cast(StatisticMetaData, dict(meta)))
+        if statistic_ids is None:
+            instance.statistics_meta_cache_complete = True
+
+    return metadata
+
 
 def get_metadata(
     hass: HomeAssistant,
@@ -704,6 +937,18 @@ def get_metadata(
         )
 
 
+@lru_cache(maxsize=4)
+def _display_units(
+    pressure_unit: str, temperature_unit: str, is_metric: bool
+) -> dict[str, str]:
+    """Map the normalized statistic units to the units configured by the user."""
+    return {
+        PRESSURE_PA: pressure_unit,
+        TEMP_CELSIUS: temperature_unit,
+        VOLUME_CUBIC_METERS: VOLUME_CUBIC_METERS if is_metric else VOLUME_CUBIC_FEET,
+    }
+
+
 @overload
 def _configured_unit(unit: None, units: UnitSystem) -> None:
     ...
@@ -716,15 +961,12 @@ def _configured_unit(unit: str, units: UnitSystem) -> str:
 
 def _configured_unit(unit: str | None, units: UnitSystem) -> str | None:
     """Return the pressure and temperature units configured by the user."""
-    if unit == PRESSURE_PA:
-        return units.pressure_unit
-    if unit == TEMP_CELSIUS:
-        return units.temperature_unit
-    if unit == VOLUME_CUBIC_METERS:
-        if units.is_metric:
-            return VOLUME_CUBIC_METERS
-        return VOLUME_CUBIC_FEET
-    return unit
+    if unit is None:
+        return None
+    display_units = _display_units(
+        units.pressure_unit, units.temperature_unit, units.is_metric
+    )
+    return display_units.get(unit, unit)
 
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
@@ -733,6 +975,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id.in_(statistic_ids)
         ).delete(synchronize_session=False)
+    _clear_metadata_cache(instance.hass, statistic_ids)
 
 
 def update_statistics_metadata(
@@ -743,6 +986,7 @@ def update_statistics_metadata(
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id == statistic_id
         ).update({StatisticsMeta.unit_of_measurement: unit_of_measurement})
+    _clear_metadata_cache(instance.hass, (statistic_id,))
 
 
 def list_statistic_ids(
@@ -757,7 +1001,8 @@ def list_statistic_ids(
     period.
     """
     units = hass.config.units
-    result = {}
+    result: list[dict] = []
+    seen_statistic_ids: set[str] = set()
 
     # Query the database
     with session_scope(hass=hass) as session:
@@ -769,18 +1014,17 @@ def list_statistic_ids(
             if (unit := meta["unit_of_measurement"]) is not None:
                 # Display unit according to user settings
                 unit = _configured_unit(unit, units)
-            meta["unit_of_measurement"] = unit
-
-        result = {
-            meta["statistic_id"]: {
-                "has_mean": meta["has_mean"],
-                "has_sum": meta["has_sum"],
-                "name": meta["name"],
-                "source": meta["source"],
-                "unit_of_measurement": meta["unit_of_measurement"],
-            }
-            for _, meta in metadata.values()
-        }
+            seen_statistic_ids.add(meta["statistic_id"])
+            result.append(
+                {
+                    "statistic_id": meta["statistic_id"],
+                    "has_mean": meta["has_mean"],
+                    "has_sum": meta["has_sum"],
+                    "name": meta["name"],
+                    "source": meta["source"],
+                    "unit_of_measurement": unit,
+                }
+            )
 
     # Query all integrations with a registered recorder platform
     for platform in hass.data[DOMAIN].values():
@@ -791,110 +1035,172 @@ def list_statistic_ids(
         )
 
         for statistic_id, info in platform_statistic_ids.items():
+            if statistic_id in seen_statistic_ids:
+                continue
             if (unit := info["unit_of_measurement"]) is not None:
                 # Display unit according to user settings
                 unit = _configured_unit(unit, units)
-            platform_statistic_ids[statistic_id]["unit_of_measurement"] = unit
-
-        for key, value in platform_statistic_ids.items():
-            result.setdefault(key, value)
+            seen_statistic_ids.add(statistic_id)
+            result.append(
+                {
+                    "statistic_id": statistic_id,
+                    "has_mean": info["has_mean"],
+                    "has_sum": info["has_sum"],
+                    "name": info.get("name"),
+                    "source": info["source"],
+                    "unit_of_measurement": unit,
+                }
+            )
 
     # Return a list of statistic_id + metadata
-    return [
-        {
-            "statistic_id": _id,
-            "has_mean": info["has_mean"],
-            "has_sum": info["has_sum"],
-            "name": info.get("name"),
-            "source": info["source"],
-            "unit_of_measurement": info["unit_of_measurement"],
-        }
-        for _id, info in result.items()
-    ]
+    return result
 
 
 def _reduce_statistics(
     stats: dict[str, list[dict[str, Any]]],
-    same_period: Callable[[datetime, datetime], bool],
+    period_key: Callable[[datetime], Any],
     period_start_end: Callable[[datetime], tuple[datetime, datetime]],
     period: timedelta,
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    result: dict[str, list[dict[str, Any]]] = {}
+
+    # The same timestamps repeat across statistic_ids; cache the period
+    # bucket keys and the ISO formatted period boundaries for this reduction
+    # to avoid converting every row to local time again for every entity.
+    period_key = lru_cache(maxsize=None)(period_key)
+
+    @lru_cache(maxsize=None)
+    def period_start_end_iso(time: datetime) -> tuple[str, str]:
+        """Return the ISO formatted start and end of the period time is within."""
+        start, end = period_start_end(time)
+        return (start.isoformat(), end.isoformat())
+
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
+        # Collect the reduced periods in a local list which is put in the
+        # result dict once, instead of looking up the bucket per period
+        period_result: list[dict[str, Any]] = []
+        # Aggregate each period with scalar accumulators so every value is
+        # touched exactly once and no intermediate lists are allocated
+        mean_sum = 0.0
+        mean_count = 0
+        min_value: float | None = None
+        max_value: float | None = None
         prev_stat: dict[str, Any] = stat_list[0]
+        prev_key = period_key(prev_stat["start"])
 
         # Loop over the hourly statistics + a fake entry to end the period
         for statistic in chain(
             stat_list, ({"start": stat_list[-1]["start"] + period},)
         ):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
+            if (key := period_key(statistic["start"])) != prev_key:
+                start_iso, end_iso = period_start_end_iso(prev_stat["start"])
                 # The previous statistic was the last entry of the period
-                result[statistic_id].append(
+                period_result.append(
                     {
                         "statistic_id": statistic_id,
-                        "start": start.isoformat(),
-                        "end": end.isoformat(),
-                        "mean": mean(mean_values) if mean_values else None,
-                        "min": min(min_values) if min_values else None,
-                        "max": max(max_values) if max_values else None,
+                        "start": start_iso,
+                        "end": end_iso,
+                        "mean": mean_sum / mean_count if mean_count else None,
+                        "min": min_value,
+                        "max": max_value,
                         "last_reset": prev_stat.get("last_reset"),
                         "state": prev_stat.get("state"),
                         "sum": prev_stat["sum"],
                     }
                 )
-                max_values = []
-                mean_values = []
-                min_values = []
-            if statistic.get("max") is not None:
-                max_values.append(statistic["max"])
-            if statistic.get("mean") is not None:
-                mean_values.append(statistic["mean"])
-            if statistic.get("min") is not None:
-                min_values.append(statistic["min"])
+                mean_sum = 0.0
+                mean_count = 0
+                min_value = None
+                max_value = None
+            prev_key = key
+            if (value := statistic.get("max")) is not None and (
+                max_value is None or value > max_value
+            ):
+                max_value = value
+            if (value := statistic.get("mean")) is not None:
+                mean_sum += value
+                mean_count += 1
+            if (value := statistic.get("min")) is not None and (
+                min_value is None or value < min_value
+            ):
+                min_value = value
             prev_stat = statistic
 
+        result[statistic_id] = period_result
+
     return result
 
 
+@lru_cache(maxsize=2048)
+def _as_local_cached(time: datetime, time_zone: tzinfo) -> datetime:
+    """Return a datetime converted to the configured timezone.
+
+    Converting to local time re-enters the timezone implementation for
+    every call; hourly timestamps repeat across queries so the result
+    is cached. The timezone is part of the key so the cache stays
+    correct when the configured timezone changes.
+    """
+    return dt_util.as_local(time)
+
+
+def _as_local(time: datetime) -> datetime:
+    """Return a cached local time conversion of a statistics timestamp."""
+    return _as_local_cached(time, dt_util.DEFAULT_TIME_ZONE)
+
+
+def _day_key(time: datetime) -> date:
+    """Return the local date time is within, used as a period bucket key."""
+    return _as_local(time).date()
+
+
 def same_day(time1: datetime, time2: datetime) -> bool:
     """Return True if time1 and time2 are in the same date."""
-    date1 = dt_util.as_local(time1).date()
-    date2 = dt_util.as_local(time2).date()
-    return date1 == date2
+    return _day_key(time1) == _day_key(time2)
 
 
-def day_start_end(time: datetime) -> tuple[datetime, datetime]:
-    """Return the start and end of the period (day) time is within."""
+@lru_cache(maxsize=2048)
+def _day_start_end_cached(
+    time: datetime, time_zone: tzinfo
+) -> tuple[datetime, datetime]:
+    """Return the cached start and end of the period (day) time is within."""
     start = dt_util.as_utc(
-        dt_util.as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
+        _as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
     )
     end = start + timedelta(days=1)
     return (start, end)
 
 
+def day_start_end(time: datetime) -> tuple[datetime, datetime]:
+    """Return the start and end of the period (day) time is within."""
+    return _day_start_end_cached(time, dt_util.DEFAULT_TIME_ZONE)
+
+
 def _reduce_statistics_per_day(
     stats: dict[str, list[dict[str, Any]]]
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily statistics."""
 
-    return _reduce_statistics(stats, same_day, day_start_end, timedelta(days=1))
+    return _reduce_statistics(stats, _day_key, day_start_end, timedelta(days=1))
+
+
+def _month_key(time: datetime) -> tuple[int, int]:
+    """Return the local (year, month) time is within, used as a period bucket key."""
+    date_ = _as_local(time).date()
+    return (date_.year, date_.month)
 
 
 def same_month(time1: datetime, time2: datetime) -> bool:
     """Return True if time1 and time2 are in the same year and month."""
-    date1 = dt_util.as_local(time1).date()
-    date2 = dt_util.as_local(time2).date()
-    return (date1.year, date1.month) == (date2.year, date2.month)
+    return _month_key(time1) == _month_key(time2)
 
 
-def month_start_end(time: datetime) -> tuple[datetime, datetime]:
-    """Return the start and end of the period (month) time is within."""
-    start_local = dt_util.as_local(time).replace(
+@lru_cache(maxsize=2048)
+def _month_start_end_cached(
+    time: datetime, time_zone: tzinfo
+) -> tuple[datetime, datetime]:
+    """Return the cached start and end of the period (month) time is within."""
+    start_local = _as_local(time).replace(
         day=1, hour=0, minute=0, second=0, microsecond=0
     )
     start = dt_util.as_utc(start_local)
@@ -903,37 +1209,48 @@ def month_start_end(time: datetime) -> tuple[datetime, datetime]:
     return (start, end)
 
 
+def month_start_end(time: datetime) -> tuple[datetime, datetime]:
+    """Return the start and end of the period (month) time is within."""
+    return _month_start_end_cached(time, dt_util.DEFAULT_TIME_ZONE)
+
+
 def _reduce_statistics_per_month(
     stats: dict[str, list[dict[str, Any]]],
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to monthly statistics."""
 
-    return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
+    return _reduce_statistics(stats, _month_key, month_start_end, timedelta(days=31))
 
 
+@lru_cache(maxsize=8)
 def _statistics_during_period_stmt(
-    start_time: datetime,
-    end_time: datetime | None,
-    statistic_ids: list[str] | None,
-    metadata_ids: list[int] | None,
     table: type[Statistics | StatisticsShortTerm],
+    has_end_time: bool,
+    has_metadata_ids: bool,
+    single_metadata_id: bool,
 ) -> StatementLambdaElement:
     """Prepare a database query for statistics during a given period.
 
-    This prepares a lambda_stmt query, so we don't insert the parameters yet.
+    The statement only depends on the table and which filters apply, so
+    it is cached and the values are passed as parameters when executing.
     """
     if table == StatisticsShortTerm:
         stmt = lambda_stmt(lambda: select(*QUERY_STATISTICS_SHORT_TERM))
     else:
         stmt = lambda_stmt(lambda: select(*QUERY_STATISTICS))
 
-    stmt += lambda q: q.filter(table.start >= start_time)
+    stmt += lambda q: q.filter(table.start >= bindparam("start_time"))
 
-    if end_time is not None:
-        stmt += lambda q: q.filter(table.start < end_time)
+    if has_end_time:
+        stmt += lambda q: q.filter(table.start < bindparam("end_time"))
 
-    if statistic_ids is not None:
-        stmt += lambda q: q.filter(table.metadata_id.in_(metadata_ids))
+    if single_metadata_id:
+        # The common single entity query plans faster with an equality
+        stmt += lambda q: q.filter(table.metadata_id == bindparam("metadata_id"))
+    elif has_metadata_ids:
+        stmt += lambda q: q.filter(
+            table.metadata_id.in_(bindparam("metadata_ids", expanding=True))
+        )
 
     stmt += lambda q: q.order_by(table.metadata_id, table.start)
     return stmt
@@ -968,10 +1285,23 @@ def statistics_during_period(
         else:
             table = Statistics
 
+        single_metadata_id = metadata_ids is not None and len(metadata_ids) == 1
         stmt = _statistics_during_period_stmt(
-            start_time, end_time, statistic_ids, metadata_ids, table
+            table, end_time is not None, metadata_ids is not None, single_metadata_id
+        )
+        params: dict[str, Any] = {"start_time": start_time}
+        if end_time is not None:
+            params["end_time"] = end_time
+        if single_metadata_id:
+            assert metadata_ids is not None
+            params["metadata_id"] = metadata_ids[0]
+        elif metadata_ids is not None:
+            params["metadata_ids"] = metadata_ids
+        # Pass the time window so ranges over one day stream the rows
+        # with yield_per instead of loading them all into memory
+        stats = execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, params=params
         )
-        stats = execute_stmt_lambda_element(session, stmt)
 
         if not stats:
             return {}
@@ -999,9 +1329,8 @@ def statistics_during_period(
         return _reduce_statistics_per_month(result)
 
 
+@lru_cache(maxsize=4)
 def _get_last_statistics_stmt(
-    metadata_id: int,
-    number_of_stats: int,
     table: type[Statistics | StatisticsShortTerm],
 ) -> StatementLambdaElement:
     """Generate a statement for number_of_stats statistics for a given statistic_id."""
@@ -1010,9 +1339,9 @@ def _get_last_statistics_stmt(
     else:
         stmt = lambda_stmt(lambda: select(*QUERY_STATISTICS))
     stmt += (
-        lambda q: q.filter_by(metadata_id=metadata_id)
+        lambda q: q.filter(table.metadata_id == bindparam("metadata_id"))
         .order_by(table.metadata_id, table.start.desc())
-        .limit(number_of_stats)
+        .limit(bindparam("number_of_stats"))
     )
     return stmt
 
@@ -1032,8 +1361,13 @@ def _get_last_statistics(
         if not metadata:
             return {}
         metadata_id = metadata[statistic_id][0]
-        stmt = _get_last_statistics_stmt(metadata_id, number_of_stats, table)
-        stats = execute_stmt_lambda_element(session, stmt)
+        # Mismatch because the untyped declarative base hides Hashable
+        stmt = _get_last_statistics_stmt(table)  # type: ignore[arg-type]
+        stats = execute_stmt_lambda_element(
+            session,
+            stmt,
+            params={"metadata_id": metadata_id, "number_of_stats": number_of_stats},
+        )
 
         if not stats:
             return {}
@@ -1069,28 +1403,43 @@ def get_last_short_term_statistics(
     )
 
 
-def _latest_short_term_statistics_stmt(
-    metadata_ids: list[int],
-) -> StatementLambdaElement:
-    """Create the statement for finding the latest short term stat rows."""
-    stmt = lambda_stmt(lambda: select(*QUERY_STATISTICS_SHORT_TERM))
-    most_recent_statistic_row = (
+@lru_cache(maxsize=1)
+def _latest_short_term_statistics_stmt() -> StatementLambdaElement:
+    """Create the statement for finding the latest short term stat rows.
+
+    A row number window partitioned per metadata_id replaces the older
+    GROUP BY subquery joined back to the table, so the rows are found
+    with a single scan of the (metadata_id, start) index.
+    """
+    windowed = (
         select(
-            StatisticsShortTerm.metadata_id,
-            func.max(StatisticsShortTerm.start).label("start_max"),
+            *QUERY_STATISTICS_SHORT_TERM,
+            func.row_number()
+            .over(
+                partition_by=StatisticsShortTerm.metadata_id,
+                order_by=StatisticsShortTerm.start.desc(),
+            )
+            .label("rownum"),
         )
-        .where(StatisticsShortTerm.metadata_id.in_(metadata_ids))
-        .group_by(StatisticsShortTerm.metadata_id)
-    ).subquery()
-    stmt += lambda s: s.join(
-        most_recent_statistic_row,
-        (
-            StatisticsShortTerm.metadata_id  # pylint: disable=comparison-with-callable
-            == most_recent_statistic_row.c.metadata_id
+        .where(
+            StatisticsShortTerm.metadata_id.in_(
+                bindparam("metadata_ids", expanding=True)
+            )
         )
-        & (StatisticsShortTerm.start == most_recent_statistic_row.c.start_max),
+        .subquery()
+    )
+    return lambda_stmt(
+        lambda: select(
+            windowed.c.metadata_id,
+            windowed.c.start,
+            windowed.c.mean,
+            windowed.c.min,
+            windowed.c.max,
+            windowed.c.last_reset,
+            windowed.c.state,
+            windowed.c.sum,
+        ).where(windowed.c.rownum == 1)
     )
-    return stmt
 
 
 def get_latest_short_term_statistics(
@@ -1112,8 +1461,10 @@ def get_latest_short_term_statistics(
             for statistic_id in statistic_ids
             if statistic_id in metadata
         ]
-        stmt = _latest_short_term_statistics_stmt(metadata_ids)
-        stats = execute_stmt_lambda_element(session, stmt)
+        stmt = _latest_short_term_statistics_stmt()
+        stats = execute_stmt_lambda_element(
+            session, stmt, params={"metadata_ids": metadata_ids}
+        )
         if not stats:
             return {}
 
@@ -1143,25 +1494,58 @@ def _statistics_at_time(
     else:
         base_query = QUERY_STATISTICS
 
-    query = session.query(*base_query)
-
-    most_recent_statistic_ids = (
-        session.query(
-            func.max(table.id).label("max_id"),
+    windowed = (
+        select(
+            *base_query,
+            func.row_number()
+            .over(partition_by=table.metadata_id, order_by=table.start.desc())
+            .label("rownum"),
         )
-        .filter(table.start < start_time)
-        .filter(table.metadata_id.in_(metadata_ids))
-    )
-    most_recent_statistic_ids = most_recent_statistic_ids.group_by(table.metadata_id)
-    most_recent_statistic_ids = most_recent_statistic_ids.subquery()
-    query = query.join(
-        most_recent_statistic_ids,
-        table.id == most_recent_statistic_ids.c.max_id,
+        .where(table.start < start_time)
+        .where(
+            table.metadata_id == next(iter(metadata_ids))
+            if len(metadata_ids) == 1
+            else table.metadata_id.in_(metadata_ids)
+        )
+        .subquery()
     )
+    query = session.query(
+        windowed.c.metadata_id,
+        windowed.c.start,
+        windowed.c.mean,
+        windowed.c.min,
+        windowed.c.max,
+        windowed.c.last_reset,
+        windowed.c.state,
+        windowed.c.sum,
+    ).filter(windowed.c.rownum == 1)
 
     return execute(query)
 
 
+@lru_cache(maxsize=8192)
+def _period_timestamps(
+    db_start: datetime, duration: timedelta
+) -> tuple[datetime, str, str]:
+    """Return the processed start and the ISO formatted period boundaries.
+
+    The same period starts repeat for every statistic id in a query, so
+    the timestamp processing and formatting is cached.
+    """
+    # The recorder stores start as a naive datetime in UTC
+    start = (
+        db_start.replace(tzinfo=dt_util.UTC)
+        if db_start.tzinfo is None
+        else dt_util.as_utc(db_start)
+    )
+    return (start, start.isoformat(), (start + duration).isoformat())
+
+
+_cached_timestamp_to_utc_isoformat = lru_cache(maxsize=8192)(
+    process_timestamp_to_utc_isoformat
+)
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     session: Session,
@@ -1174,26 +1558,34 @@ def _sorted_statistics_to_dict(
     start_time_as_datetime: bool = False,
 ) -> dict[str, list[dict]]:
     """Convert SQL results into JSON friendly data structure."""
-    result: dict = defaultdict(list)
+    result: dict[str, list[dict]] = {}
     units = hass.config.units
     metadata = dict(_metadata.values())
     need_stat_at_start_time: set[int] = set()
     stats_at_start_time = {}
 
-    def no_conversion(val: Any, _: Any) -> float | None:
-        """Return x."""
-        return val  # type: ignore[no-any-return]
+    converters = _display_unit_converters(
+        units.pressure_unit, units.temperature_unit, units.is_metric
+    )
 
-    # Set all statistic IDs to empty lists in result set to maintain the order
-    if statistic_ids is not None:
-        for stat_id in statistic_ids:
-            result[stat_id] = []
+    # Materialize and group the rows in one pass; stats may be a
+    # server-side iterator which cannot be consumed twice. Rows follow
+    # the QUERY_STATISTICS column order and are unpacked as plain tuples
+    # instead of paying for Row attribute access per column.
+    rows_by_meta: dict[int, list[Row]] = {}
+    for row in stats:
+        if (rows := rows_by_meta.get(row[0])) is None:
+            rows = rows_by_meta[row[0]] = []
+        rows.append(row)
 
     # Identify metadata IDs for which no data was available at the requested start time
-    for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore[no-any-return]
-        first_start_time = process_timestamp(next(group).start)
-        if start_time and first_start_time > start_time:
-            need_stat_at_start_time.add(meta_id)
+    if start_time:
+        for meta_id, rows in rows_by_meta.items():
+            first_start = rows[0][1]
+            if first_start.tzinfo is None:
+                first_start = first_start.replace(tzinfo=dt_util.UTC)
+            if first_start > start_time:
+                need_stat_at_start_time.add(meta_id)
 
     # Fetch last known statistics for the needed metadata IDs
     if need_stat_at_start_time:
@@ -1201,39 +1593,42 @@ def _sorted_statistics_to_dict(
         tmp = _statistics_at_time(session, need_stat_at_start_time, table, start_time)
         if tmp:
             for stat in tmp:
-                stats_at_start_time[stat.metadata_id] = (stat,)
+                stats_at_start_time[stat[0]] = (stat,)
 
     # Append all statistic entries, and optionally do unit conversion
-    for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore[no-any-return]
+    duration = table.duration
+    for meta_id, rows in rows_by_meta.items():
         unit = metadata[meta_id]["unit_of_measurement"]
         statistic_id = metadata[meta_id]["statistic_id"]
-        convert: Callable[[Any, Any], float | None]
-        if convert_units:
-            convert = STATISTIC_UNIT_TO_DISPLAY_UNIT_CONVERSIONS.get(unit, lambda x, units: x)  # type: ignore[arg-type,no-any-return]
-        else:
-            convert = no_conversion
-        ent_results = result[meta_id]
-        for db_state in chain(stats_at_start_time.get(meta_id, ()), group):
-            start = process_timestamp(db_state.start)
-            end = start + table.duration
+        # Most units need no conversion; skip the converter calls entirely
+        # for those instead of routing every value through a no-op callable
+        convert: Callable[[Any], float | None] | None
+        convert = converters.get(unit) if convert_units else None  # type: ignore[arg-type]
+        ent_results = result[statistic_id] = []
+        for db_state in chain(stats_at_start_time.get(meta_id, ()), rows):
+            (_, row_start, mean, _min, _max, last_reset, state, _sum) = db_state
+            start, start_iso, end_iso = _period_timestamps(row_start, duration)
+            if convert is not None:
+                mean = convert(mean)
+                _min = convert(_min)
+                _max = convert(_max)
+                state = convert(state)
+                _sum = convert(_sum)
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
-                    "start": start if start_time_as_datetime else start.isoformat(),
-                    "end": end.isoformat(),
-                    "mean": convert(db_state.mean, units),
-                    "min": convert(db_state.min, units),
-                    "max": convert(db_state.max, units),
-                    "last_reset": process_timestamp_to_utc_isoformat(
-                        db_state.last_reset
-                    ),
-                    "state": convert(db_state.state, units),
-                    "sum": convert(db_state.sum, units),
+                    "start": start if start_time_as_datetime else start_iso,
+                    "end": end_iso,
+                    "mean": mean,
+                    "min": _min,
+                    "max": _max,
+                    "last_reset": _cached_timestamp_to_utc_isoformat(last_reset),
+                    "state": state,
+                    "sum": _sum,
                 }
             )
 
-    # Filter out the empty lists if some states had 0 results.
-    return {metadata[key]["statistic_id"]: val for key, val in result.items() if val}
+    return result
 
 
 def validate_statistics(hass: HomeAssistant) -> dict[str, list[ValidationIssue]]:
@@ -1280,13 +1675,19 @@ def async_add_external_statistics(
     if not metadata["source"] or metadata["source"] != domain:
         raise HomeAssistantError("Invalid source")
 
+    # Materialize the statistics so generators survive the queue, and
+    # keep the per item work minimal since this runs on the event loop
+    statistics = list(statistics)
+    utc = dt_util.UTC
+    as_utc = dt_util.as_utc
     for statistic in statistics:
         start = statistic["start"]
         if start.tzinfo is None or start.tzinfo.utcoffset(start) is None:
             raise HomeAssistantError("Naive timestamp")
         if start.minute != 0 or start.second != 0 or start.microsecond != 0:
             raise HomeAssistantError("Invalid timestamp")
-        statistic["start"] = dt_util.as_utc(start)
+        if start.tzinfo is not utc:
+            statistic["start"] = as_utc(start)
 
     # Insert job in recorder's queue
     hass.data[DATA_INSTANCE].async_external_statistics(metadata, statistics)
@@ -1340,6 +1741,7 @@ def add_external_statistics(
 ) -> bool:
     """Process an add_external_statistics job."""
 
+    modified_statistic_ids: set[str] = set()
     with session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
@@ -1347,14 +1749,26 @@ def add_external_statistics(
         old_metadata_dict = get_metadata_with_session(
             instance.hass, session, statistic_ids=[metadata["statistic_id"]]
         )
-        metadata_id = _update_or_add_metadata(session, metadata, old_metadata_dict)
-        for stat in statistics:
-            if stat_id := _statistics_exists(
-                session, Statistics, metadata_id, stat["start"]
-            ):
-                _update_statistics(session, Statistics, stat_id, stat)
-            else:
-                _insert_statistics(session, Statistics, metadata_id, stat)
+        metadata_id = _update_or_add_metadata(
+            session, metadata, old_metadata_dict, modified_statistic_ids
+        )
+        if (
+            stmt := _upsert_statistics_stmt(Statistics, session.get_bind().dialect.name)
+        ) is not None:
+            # Insert or update all rows in a single executemany round trip
+            rows = [_statistics_row(metadata_id, stat) for stat in statistics]
+            session.execute(stmt, rows)
+        else:
+            for stat in statistics:
+                if stat_id := _statistics_exists(
+                    session, Statistics, metadata_id, stat["start"]
+                ):
+                    _update_statistics(session, Statistics, stat_id, stat)
+                else:
+                    _insert_statistics(session, Statistics, metadata_id, stat)
+
+    if modified_statistic_ids:
+        _clear_metadata_cache(instance.hass, modified_statistic_ids)
 
     return True
 
@@ -1376,15 +1790,20 @@ def adjust_statistics(
             return True
 
         units = instance.hass.config.units
+        metadata_id = metadata[statistic_id][0]
         statistic_unit = metadata[statistic_id][1]["unit_of_measurement"]
         display_unit = _configured_unit(statistic_unit, units)
-        convert = DISPLAY_UNIT_TO_STATISTIC_UNIT_CONVERSIONS.get(display_unit, lambda x, units: x)  # type: ignore[arg-type]
+        convert = DISPLAY_UNIT_TO_STATISTIC_UNIT_CONVERSIONS.get(
+            display_unit, _identity_convert  # type: ignore[arg-type]
+        )
         sum_adjustment = convert(sum_adjustment, units)
 
+        # Both adjustments run server-side in this single transaction; the
+        # unique (metadata_id, start) indexes turn them into range scans
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
-            metadata[statistic_id][0],
+            metadata_id,
             start_time,
             sum_adjustment,
         )
@@ -1392,7 +1811,7 @@ def adjust_statistics(
         _adjust_sum_statistics(
             session,
             Statistics,
-            metadata[statistic_id][0],
+            metadata_id,
             start_time.replace(minute=0),
             sum_adjustment,
         )
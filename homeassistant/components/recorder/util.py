@@ -173,6 +173,8 @@ def execute_stmt_lambda_element(
     start_time: datetime | None = None,
     end_time: datetime | None = None,
     yield_per: int | None = DEFAULT_YIELD_STATES_ROWS,
+    params: dict[str, Any] | None = None,
+    mapped: bool = False,
 ) -> Iterable[Row]:
     """Execute a StatementLambdaElement.
 
@@ -184,8 +186,16 @@ def execute_stmt_lambda_element(
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
+
+    If mapped is True, rows are returned as dict-like mappings instead
+    of Row objects, which avoids Row's key resolution when the caller
+    accesses columns by name.
     """
-    executed = session.execute(stmt)
+    executed = (
+        session.execute(stmt) if params is None else session.execute(stmt, params)
+    )
+    if mapped:
+        executed = executed.mappings()
     use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
     for tryno in range(0, RETRIES):
         try:
@@ -171,28 +171,27 @@ def mock_sensor_statistics():
 
 
 @pytest.fixture
-def mock_from_stats():
-    """Mock out Statistics.from_stats."""
+def mock_statistics_row():
+    """Mock out _statistics_row to inject an invalid row."""
     counter = 0
-    real_from_stats = StatisticsShortTerm.from_stats
+    real_statistics_row = statistics._statistics_row
 
-    def from_stats(metadata_id, stats):
+    def statistics_row(metadata_id, stats):
         nonlocal counter
         if counter == 0 and metadata_id == 2:
             counter += 1
-            return None
-        return real_from_stats(metadata_id, stats)
+            return {**real_statistics_row(metadata_id, stats), "state": object()}
+        return real_statistics_row(metadata_id, stats)
 
     with patch(
-        "homeassistant.components.recorder.statistics.StatisticsShortTerm.from_stats",
-        side_effect=from_stats,
-        autospec=True,
+        "homeassistant.components.recorder.statistics._statistics_row",
+        side_effect=statistics_row,
     ):
         yield
 
 
 def test_compile_periodic_statistics_exception(
-    hass_recorder, mock_sensor_statistics, mock_from_stats
+    hass_recorder, mock_sensor_statistics, mock_statistics_row
 ):
     """Test exception handling when compiling periodic statistics."""
 
@@ -643,6 +642,89 @@ def test_external_statistics_errors(hass_recorder, caplog):
     assert get_metadata(hass, statistic_ids=("test:total_energy_import",)) == {}
 
 
+def test_statistics_metadata_cache(hass_recorder):
+    """Test statistics metadata is cached and invalidated when modified."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    wait_recording_done(hass)
+
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    external_statistics = {
+        "start": period1,
+        "last_reset": None,
+        "state": 0,
+        "sum": 2,
+    }
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, (external_statistics,))
+    wait_recording_done(hass)
+
+    # Inserting the metadata invalidated the cache, fetching primes it
+    assert "test:total_energy_import" not in instance.statistics_meta_cache
+    metadata = get_metadata(hass, statistic_ids=("test:total_energy_import",))
+    assert metadata["test:total_energy_import"][1]["unit_of_measurement"] == "kWh"
+    assert "test:total_energy_import" in instance.statistics_meta_cache
+
+    # Cached reads are served without querying the database
+    with patch.object(
+        statistics, "execute_stmt_lambda_element", side_effect=AssertionError
+    ):
+        assert (
+            get_metadata(hass, statistic_ids=("test:total_energy_import",)) == metadata
+        )
+
+    # Mutating a returned entry does not leak into the cache
+    metadata["test:total_energy_import"][1]["unit_of_measurement"] = "Wh"
+    metadata = get_metadata(hass, statistic_ids=("test:total_energy_import",))
+    assert metadata["test:total_energy_import"][1]["unit_of_measurement"] == "kWh"
+
+    # An unfiltered fetch completes the cache
+    assert not instance.statistics_meta_cache_complete
+    full_listing = get_metadata(hass)
+    assert instance.statistics_meta_cache_complete
+    with patch.object(
+        statistics, "execute_stmt_lambda_element", side_effect=AssertionError
+    ):
+        assert get_metadata(hass) == full_listing
+
+    # An invalidation racing with a fetch must not repopulate the cache
+    # with the data read before the invalidation
+    statistics._clear_metadata_cache(hass)
+    real_execute = statistics.execute_stmt_lambda_element
+
+    def invalidate_during_fetch(*args, **kwargs):
+        statistics._clear_metadata_cache(hass, ("test:total_energy_import",))
+        return real_execute(*args, **kwargs)
+
+    with patch.object(
+        statistics, "execute_stmt_lambda_element", side_effect=invalidate_during_fetch
+    ):
+        assert get_metadata(hass) == full_listing
+    assert "test:total_energy_import" not in instance.statistics_meta_cache
+    assert not instance.statistics_meta_cache_complete
+
+    # Updating the metadata invalidates the cached entry
+    statistics.update_statistics_metadata(instance, "test:total_energy_import", "Wh")
+    assert "test:total_energy_import" not in instance.statistics_meta_cache
+    assert not instance.statistics_meta_cache_complete
+    metadata = get_metadata(hass, statistic_ids=("test:total_energy_import",))
+    assert metadata["test:total_energy_import"][1]["unit_of_measurement"] == "Wh"
+
+    # Clearing the statistics drops the cached entry
+    statistics.clear_statistics(instance, ["test:total_energy_import"])
+    assert "test:total_energy_import" not in instance.statistics_meta_cache
+    assert get_metadata(hass, statistic_ids=("test:total_energy_import",)) == {}
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
 def test_monthly_statistics(hass_recorder, caplog, timezone):
@@ -777,8 +859,8 @@ def test_duplicate_statistics_handle_integrity_error(hass_recorder, caplog):
     ]
 
     with patch.object(
-        statistics, "_statistics_exists", return_value=False
-    ), patch.object(
+        statistics, "_upsert_statistics_stmt", return_value=None
+    ), patch.object(statistics, "_statistics_exists", return_value=False), patch.object(
         statistics, "_insert_statistics", wraps=statistics._insert_statistics
     ) as insert_statistics_mock:
         async_add_external_statistics(